@@ -16,6 +16,17 @@ const GENERIC_DOMAINS = [
   'mozmail.com'
 ];
 
+const INTERNAL_DOMAINS = ['jarvio.io', 'jarvioapp.com'];
+
+// Domain suffix -> class, mirrors src/identity.py. Lookups walk label
+// suffixes ("eu.jarvio.io" -> "jarvio.io") instead of scanning the lists.
+const DOMAIN_CLASSES = new Map([
+  ...GENERIC_DOMAINS.map(d => [d, 'generic']),
+  ...INTERNAL_DOMAINS.map(d => [d, 'internal']),
+  ['anonymous', 'anonymous'],
+  ['personal-email', 'anonymous']
+]);
+
 const SESSION_GAP_MINUTES = 30; // gap threshold for session splitting
 
 module.exports = async function handler(req, res) {
@@ -47,8 +58,9 @@ module.exports = async function handler(req, res) {
     // Step 1: Get all persons (users) with their events
     const userData = await fetchAllUserEvents(HOST, PROJECT_ID, API_KEY, startStr, endStr);
 
-    // Step 2: Group by organization domain
+    // Step 2: Group by organization domain, classifying each domain once
     const orgMap = {};
+    const classCache = new Map();
     for (const [identifier, data] of Object.entries(userData)) {
       let domain, displayName;
       if (identifier.includes('@')) {
@@ -56,7 +68,7 @@ module.exports = async function handler(req, res) {
         displayName = identifier;
         if (!domain) continue;
         // Group generic email domains (gmail, yahoo, etc.) under "personal-email"
-        if (GENERIC_DOMAINS.includes(domain)) {
+        if (classifyDomain(domain, classCache) === 'generic') {
           domain = 'personal-email';
         }
       } else {
@@ -72,6 +84,7 @@ module.exports = async function handler(req, res) {
     // Step 3: Build TIME_SERIES_DATA format
     const organizations = Object.entries(orgMap).map(([domain, users]) => ({
       name: domain,
+      domainClass: classifyDomain(domain, classCache),
       users: users.map(u => ({
         email: u.email,
         totalTimeMinutes: Math.round(u.totalTimeMinutes),
@@ -103,6 +116,19 @@ module.exports = async function handler(req, res) {
   }
 };
 
+function classifyDomain(domain, cache) {
+  let cls = cache.get(domain);
+  if (cls) return cls;
+  cls = 'customer';
+  const labels = domain.split('.');
+  for (let i = 0; i < labels.length; i++) {
+    const match = DOMAIN_CLASSES.get(labels.slice(i).join('.'));
+    if (match) { cls = match; break; }
+  }
+  cache.set(domain, cls);
+  return cls;
+}
+
 function fmt(d) {
   return d.toISOString().split('T')[0];
 }
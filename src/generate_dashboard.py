@@ -9,6 +9,10 @@ proportions instead of leaving timeMinutes at 0.
 import json
 from datetime import datetime
 
+from identity import classify_domain
+from quantiles import TDigest
+from timeseries_store import STORE_EXT, TimeSeriesStore
+
 
 def transform_for_dashboard(customer_data):
     """Transform customer data to dashboard format"""
@@ -16,8 +20,11 @@ def transform_for_dashboard(customer_data):
 
     for customer in customer_data['customers']:
         users = []
+        org_sketch = TDigest()
         for user in customer['users']:
             daily_data = {}
+            # Streaming sketch of this user's daily minutes
+            sketch = TDigest()
 
             # Distribute user's total time across org's active days
             # proportionally by daily event counts
@@ -41,6 +48,7 @@ def transform_for_dashboard(customer_data):
                                 'timeMinutes': day_time,
                                 'events': day_events
                             }
+                            sketch.add(day_time)
                 else:
                     # No event data - distribute evenly across days
                     num_days = len(customer['dailyData'])
@@ -50,6 +58,7 @@ def transform_for_dashboard(customer_data):
                             'timeMinutes': per_day_time,
                             'events': 0
                         }
+                        sketch.add(per_day_time)
 
             user_obj = {
                 'email': user['email'],
@@ -60,13 +69,18 @@ def transform_for_dashboard(customer_data):
                     'completed': 0,
                     'failed': 0
                 },
-                'dailyData': daily_data
+                'dailyData': daily_data,
+                'timePercentiles': sketch.percentiles()
             }
             users.append(user_obj)
+            org_sketch.merge(sketch)
 
         org_obj = {
             'name': customer['name'],
-            'users': users
+            'domainClass': customer.get('domainClass') or classify_domain(customer['name']),
+            'users': users,
+            'timePercentiles': org_sketch.percentiles(),
+            'timeSketch': org_sketch.to_dict()
         }
         organizations.append(org_obj)
 
@@ -77,6 +91,48 @@ def transform_for_dashboard(customer_data):
     }
 
 
+def load_from_store(store_path, start_date=None, end_date=None):
+    """
+    Build dashboard data from a binary time-series store.
+
+    Only the day range [start_date, end_date] of each user row is read, so
+    narrowing the range avoids paging in the rest of the dataset.
+    """
+    with TimeSeriesStore(store_path) as store:
+        organizations = []
+        for name, domain_class in store.orgs():
+            users = []
+            org_sketch = TDigest()
+            for row_id, meta in store.users(name):
+                daily_data = store.user_range(row_id, start_date, end_date)
+                sketch = TDigest()
+                for values in daily_data.values():
+                    del values['flows']
+                    sketch.add(values['timeMinutes'])
+                users.append({
+                    'email': meta['email'],
+                    'totalTimeMinutes': meta['totalTimeMinutes'],
+                    'events': meta['events'],
+                    'flows': meta['flows'],
+                    'dailyData': daily_data,
+                    'timePercentiles': sketch.percentiles()
+                })
+                org_sketch.merge(sketch)
+            organizations.append({
+                'name': name,
+                'domainClass': domain_class or classify_domain(name),
+                'users': users,
+                'timePercentiles': org_sketch.percentiles(),
+                'timeSketch': org_sketch.to_dict()
+            })
+
+        return {
+            'organizations': organizations,
+            'startDate': start_date or store.start_date,
+            'endDate': end_date or store.end_date
+        }
+
+
 def embed_in_dashboard(dashboard_path, dashboard_data):
     """Embed the data directly into dashboard.html by replacing the TIME_SERIES_DATA constant."""
     import re
@@ -102,10 +158,12 @@ def main():
     json_path = sys.argv[1] if len(sys.argv) > 1 else 'data/customer_data.json'
     dashboard_path = sys.argv[2] if len(sys.argv) > 2 else 'dashboard.html'
 
-    with open(json_path, 'r') as f:
-        customer_data = json.load(f)
-
-    dashboard_data = transform_for_dashboard(customer_data)
+    if json_path.endswith(STORE_EXT):
+        dashboard_data = load_from_store(json_path)
+    else:
+        with open(json_path, 'r') as f:
+            customer_data = json.load(f)
+        dashboard_data = transform_for_dashboard(customer_data)
 
     # Embed directly into dashboard HTML
     embed_in_dashboard(dashboard_path, dashboard_data)
@@ -123,7 +181,9 @@ def main():
         hours = total_time // 60
         minutes = total_time % 60
         user_count = len(org['users'])
-        print(f"  {org['name']}: {hours}h {minutes}m ({user_count} users)")
+        pct = org['timePercentiles']
+        print(f"  {org['name']}: {hours}h {minutes}m ({user_count} users), "
+              f"daily minutes p50/p90/p99: {pct['p50']}/{pct['p90']}/{pct['p99']}")
         for u in org['users']:
             daily_times = [v['timeMinutes'] for v in u['dailyData'].values()]
             print(f"    {u['email']}: {u['totalTimeMinutes']}m total, daily: {daily_times[:5]}...")
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Identity resolution for PostHog identifiers.
+
+Every identifier (email or anonymous distinct_id) is resolved exactly once into
+an interned (display_name, org, domain_class) triple. Domain classification uses
+a suffix trie keyed on reversed domain labels, so "eu.jarvio.io" matches the
+"jarvio.io" entry in one walk instead of a scan over every known domain.
+
+Domain classes:
+- customer:  a real customer organisation (default)
+- generic:   free email providers (gmail.com, outlook.com, ...)
+- internal:  our own domains, hidden on the dashboard by default
+- anonymous: identifiers without an email, and the 'personal-email' bucket
+"""
+
+import sys
+
+CUSTOMER = 'customer'
+GENERIC = 'generic'
+INTERNAL = 'internal'
+ANONYMOUS = 'anonymous'
+
+GENERIC_DOMAINS = [
+    'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com',
+    'icloud.com', 'protonmail.com', 'aol.com', 'mail.com',
+    'mozmail.com'
+]
+
+INTERNAL_DOMAINS = ['jarvio.io', 'jarvioapp.com']
+
+# Org buckets produced by grouping rather than by a real domain
+ANONYMOUS_ORG = 'anonymous'
+PERSONAL_EMAIL_ORG = 'personal-email'
+
+
+class DomainTrie:
+    """Suffix trie over reversed domain labels ('a.b.com' -> com, b, a)."""
+
+    _CLASS = '$class'
+
+    def __init__(self):
+        self._root = {}
+
+    def add(self, domain, domain_class):
+        node = self._root
+        for label in reversed(domain.lower().split('.')):
+            node = node.setdefault(sys.intern(label), {})
+        node[self._CLASS] = domain_class
+
+    def lookup(self, domain):
+        """Return the class of the longest registered suffix of domain, or None."""
+        node = self._root
+        found = None
+        for label in reversed(domain.split('.')):
+            node = node.get(label)
+            if node is None:
+                break
+            found = node.get(self._CLASS, found)
+        return found
+
+
+def build_default_trie():
+    trie = DomainTrie()
+    for domain in GENERIC_DOMAINS:
+        trie.add(domain, GENERIC)
+    for domain in INTERNAL_DOMAINS:
+        trie.add(domain, INTERNAL)
+    trie.add(ANONYMOUS_ORG, ANONYMOUS)
+    trie.add(PERSONAL_EMAIL_ORG, ANONYMOUS)
+    return trie
+
+
+class IdentityResolver:
+    """
+    Resolve identifiers to (display_name, org, domain_class), caching per identifier.
+
+    Emails, org names and classes are interned so millions of rows sharing a
+    handful of domains hold references to one string each.
+    """
+
+    def __init__(self, trie=None):
+        self.trie = trie or build_default_trie()
+        self._identifiers = {}
+        self._domains = {}
+
+    def classify_domain(self, domain):
+        """Return the domain class for an org/domain name."""
+        domain = domain.strip().lower()
+        cls = self._domains.get(domain)
+        if cls is None:
+            cls = self.trie.lookup(domain) or CUSTOMER
+            self._domains[sys.intern(domain)] = cls
+        return cls
+
+    def resolve(self, identifier):
+        """
+        Return (display_name, org, domain_class) for a raw identifier, or None
+        if it is an email without a domain.
+
+        Generic-domain emails are grouped under 'personal-email', and
+        non-email identifiers under 'anonymous', matching api/refresh.js.
+        """
+        cached = self._identifiers.get(identifier)
+        if cached is not None or identifier in self._identifiers:
+            return cached
+
+        clean = identifier.strip().lower()
+        if '@' in clean:
+            domain = clean.split('@')[1]
+            if not domain:
+                resolved = None
+            else:
+                cls = self.classify_domain(domain)
+                org = PERSONAL_EMAIL_ORG if cls == GENERIC else domain
+                resolved = (sys.intern(clean), sys.intern(org),
+                            self.classify_domain(org))
+        else:
+            resolved = (sys.intern('anon-' + clean[:8]), ANONYMOUS_ORG, ANONYMOUS)
+
+        self._identifiers[identifier] = resolved
+        return resolved
+
+
+_default_resolver = None
+
+
+def default_resolver():
+    """Shared resolver so repeated calls across the pipeline hit one cache."""
+    global _default_resolver
+    if _default_resolver is None:
+        _default_resolver = IdentityResolver()
+    return _default_resolver
+
+
+def classify_domain(domain):
+    return default_resolver().classify_domain(domain)
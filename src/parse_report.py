@@ -11,9 +11,12 @@ by event count.
 """
 
 import re
+import sys
 import json
 from datetime import datetime, timedelta
 
+from identity import classify_domain
+
 
 def parse_markdown_report(filepath):
     """Parse the markdown report and extract structured data"""
@@ -27,10 +30,11 @@ def parse_markdown_report(filepath):
 
     for section in sections[1:]:  # Skip the header section
         lines = section.strip().split('\n')
-        domain = lines[0].strip()
+        domain = sys.intern(lines[0].strip().lower())
 
         customer_data = {
             'name': domain,
+            'domainClass': classify_domain(domain),
             'users': [],
             'totalTimeMinutes': 0,
             'totalEvents': 0,
@@ -99,7 +103,7 @@ def parse_markdown_report(filepath):
             elif in_users_section and line.startswith('-'):
                 match = re.search(r'-\s*([^:]+):\s*([0-9,]+)\s+events?,\s*(\d+)m\s+time,\s*([0-9,]+)\s+flows?', line)
                 if match:
-                    email = match.group(1).strip()
+                    email = sys.intern(match.group(1).strip().lower())
                     events = int(match.group(2).replace(',', ''))
                     time_minutes = int(match.group(3))
                     flows = int(match.group(4).replace(',', ''))
@@ -184,7 +188,6 @@ def _fix_user_time(customer_data):
 
 
 if __name__ == '__main__':
-    import sys
     report_path = sys.argv[1] if len(sys.argv) > 1 else 'data/sample_report.md'
     output_path = sys.argv[2] if len(sys.argv) > 2 else 'data/customer_data.json'
 
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Fetch dashboard data from one or more PostHog projects (e.g. EU and US hosts).
+
+All projects are queried concurrently with the same HogQL queries as
+api/refresh.js. Each project's rows are sorted by (identifier, day) and the
+streams are k-way merged with heapq.merge, so a user's dailyData is combined
+across projects in a single pass without building a dict per project. Total
+refresh time is close to the slowest project rather than the sum.
+
+Sources come from POSTHOG_SOURCES, a comma-separated list of
+project_id@host entries (an optional :api_key suffix overrides
+POSTHOG_API_KEY for that project), e.g.
+
+    POSTHOG_SOURCES=54557@https://eu.i.posthog.com,1234@https://us.i.posthog.com
+
+Without it, the single POSTHOG_PROJECT_ID / POSTHOG_HOST pair is used.
+
+Usage:
+    python3 src/posthog_sources.py [dashboard.html] [days]
+"""
+
+import heapq
+import json
+import os
+import sys
+import urllib.error
+import urllib.request
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from itertools import groupby
+from operator import itemgetter
+
+from identity import default_resolver
+from quantiles import TDigest
+
+DEFAULT_PROJECT_ID = '54557'
+DEFAULT_HOST = 'https://eu.i.posthog.com'
+REQUEST_TIMEOUT = 60
+
+Source = namedtuple('Source', ['project_id', 'host', 'api_key'])
+
+EVENTS_QUERY = """
+    SELECT
+      coalesce(person.properties.email, distinct_id) as identifier,
+      toDate(timestamp) as day,
+      count() as event_count,
+      uniq(toStartOfMinute(timestamp)) as active_minutes
+    FROM events
+    WHERE timestamp >= '{start}'
+      AND timestamp <= '{end}T23:59:59'
+    GROUP BY identifier, day
+    ORDER BY identifier, day
+    LIMIT 100000
+"""
+
+FLOWS_QUERY = """
+    SELECT
+      coalesce(person.properties.email, distinct_id) as identifier,
+      event,
+      count() as cnt
+    FROM events
+    WHERE timestamp >= '{start}'
+      AND timestamp <= '{end}T23:59:59'
+      AND event IN ('flow_started', 'flow_completed', 'flow_failed',
+                    'Flow Started', 'Flow Completed', 'Flow Failed',
+                    '$flow_started', '$flow_completed', '$flow_failed')
+    GROUP BY identifier, event
+    ORDER BY identifier
+"""
+
+
+def sources_from_env(env=None):
+    """Return the configured list of Source entries."""
+    env = os.environ if env is None else env
+    api_key = env.get('POSTHOG_API_KEY')
+    spec = env.get('POSTHOG_SOURCES', '').strip()
+    if not spec:
+        return [Source(env.get('POSTHOG_PROJECT_ID', DEFAULT_PROJECT_ID),
+                       env.get('POSTHOG_HOST', DEFAULT_HOST), api_key)]
+
+    sources = []
+    for entry in spec.split(','):
+        entry = entry.strip()
+        if not entry:
+            continue
+        project_id, _, host = entry.partition('@')
+        key = api_key
+        # host contains "https://" and maybe a port, so only a non-numeric
+        # ":suffix" after the last slash is an API key
+        head, slash, tail = host.rpartition('/')
+        name, colon, suffix = tail.rpartition(':')
+        if colon and not suffix.isdigit():
+            host = head + slash + name
+            key = suffix
+        if not project_id or not host:
+            raise ValueError(f"Invalid POSTHOG_SOURCES entry: {entry!r} (expected project_id@host)")
+        sources.append(Source(project_id, host.rstrip('/'), key))
+    return sources
+
+
+def hogql(source, query):
+    """Run a HogQL query against one project and return its result rows."""
+    if not source.api_key:
+        raise RuntimeError(f"POSTHOG_API_KEY not configured for project {source.project_id}")
+    url = f"{source.host}/api/projects/{source.project_id}/query/"
+    body = json.dumps({'query': {'kind': 'HogQLQuery', 'query': query}}).encode()
+    req = urllib.request.Request(url, data=body, method='POST', headers={
+        'Authorization': f'Bearer {source.api_key}',
+        'Content-Type': 'application/json'
+    })
+    try:
+        with urllib.request.urlopen(req, timeout=REQUEST_TIMEOUT) as resp:
+            return json.load(resp).get('results') or []
+    except urllib.error.HTTPError as e:
+        text = e.read().decode(errors='replace')
+        raise RuntimeError(f"PostHog API {e.code} ({source.host}): {text[:500]}") from e
+
+
+def fetch_event_rows(source, start, end):
+    """
+    Return (identifier, day, events, minutes) rows for one project, sorted by
+    (identifier, day) after identifier normalisation.
+    """
+    rows = []
+    for identifier, day, events, minutes in hogql(source, EVENTS_QUERY.format(start=start, end=end)):
+        if not identifier:
+            continue
+        day = day.split(' ')[0] if isinstance(day, str) else str(day)
+        rows.append((identifier.strip().lower(), day, events, minutes or 0))
+    # Already ordered by the query; lowercasing can only locally reorder, which
+    # Timsort handles in near-linear time.
+    rows.sort(key=itemgetter(0, 1))
+    return rows
+
+
+def fetch_flow_rows(source, start, end):
+    """Return (identifier, event, count) rows sorted by identifier. Failures are non-fatal."""
+    try:
+        rows = hogql(source, FLOWS_QUERY.format(start=start, end=end))
+    except (RuntimeError, OSError) as e:
+        print(f"⚠️  Flow query failed for project {source.project_id} (non-fatal): {e}",
+              file=sys.stderr)
+        return []
+    rows = [(identifier.strip().lower(), event, count)
+            for identifier, event, count in rows if identifier]
+    rows.sort(key=itemgetter(0))
+    return rows
+
+
+def fetch_all(sources, start, end):
+    """Query every project concurrently; return (event_streams, flow_streams)."""
+    with ThreadPoolExecutor(max_workers=2 * len(sources)) as pool:
+        events = [pool.submit(fetch_event_rows, s, start, end) for s in sources]
+        flows = [pool.submit(fetch_flow_rows, s, start, end) for s in sources]
+        return [f.result() for f in events], [f.result() for f in flows]
+
+
+def merge_users(event_streams, flow_streams):
+    """
+    K-way merge per-project streams into one record per identifier.
+
+    Yields (identifier, user) in identifier order, where user has totalEvents,
+    totalTimeMinutes, flowsStarted/Completed/Failed and dailyData. The same day
+    reported by several projects is summed. Flow rows are merge-joined against
+    the event stream, so identifiers with flows but no events are dropped, as
+    in api/refresh.js.
+    """
+    flows = heapq.merge(*flow_streams, key=itemgetter(0))
+    pending = next(flows, None)
+
+    merged = heapq.merge(*event_streams, key=itemgetter(0, 1))
+    for identifier, rows in groupby(merged, key=itemgetter(0)):
+        user = {
+            'totalEvents': 0,
+            'totalTimeMinutes': 0,
+            'flowsStarted': 0,
+            'flowsCompleted': 0,
+            'flowsFailed': 0,
+            'dailyData': {}
+        }
+        for day, day_rows in groupby(rows, key=itemgetter(1)):
+            events = minutes = 0
+            for _, _, row_events, row_minutes in day_rows:
+                events += row_events
+                minutes += row_minutes
+            user['totalEvents'] += events
+            user['totalTimeMinutes'] += minutes
+            user['dailyData'][day] = {
+                'timeMinutes': round(minutes, 1),
+                'events': events
+            }
+
+        while pending is not None and pending[0] < identifier:
+            pending = next(flows, None)
+        while pending is not None and pending[0] == identifier:
+            event = pending[1].lower().replace('$', '')
+            if 'started' in event:
+                user['flowsStarted'] += pending[2]
+            elif 'completed' in event:
+                user['flowsCompleted'] += pending[2]
+            elif 'failed' in event:
+                user['flowsFailed'] += pending[2]
+            pending = next(flows, None)
+
+        yield identifier, user
+
+
+def build_dashboard_data(users, start, end, resolver=None):
+    """Group merged users into TIME_SERIES_DATA organizations."""
+    resolver = resolver or default_resolver()
+    orgs = {}
+    for identifier, user in users:
+        resolved = resolver.resolve(identifier)
+        if resolved is None:
+            continue
+        display_name, org, domain_class = resolved
+
+        entry = orgs.get(org)
+        if entry is None:
+            entry = orgs[org] = {'name': org, 'domainClass': domain_class,
+                                 'users': [], 'sketch': TDigest()}
+
+        sketch = TDigest()
+        for day in user['dailyData'].values():
+            sketch.add(day['timeMinutes'])
+        entry['sketch'].merge(sketch)
+        entry['users'].append({
+            'email': display_name,
+            'totalTimeMinutes': round(user['totalTimeMinutes']),
+            'events': user['totalEvents'],
+            'flows': {
+                'started': user['flowsStarted'],
+                'completed': user['flowsCompleted'],
+                'failed': user['flowsFailed']
+            },
+            'dailyData': user['dailyData'],
+            'timePercentiles': sketch.percentiles()
+        })
+
+    organizations = []
+    for entry in orgs.values():
+        org_sketch = entry.pop('sketch')
+        entry['timePercentiles'] = org_sketch.percentiles()
+        entry['timeSketch'] = org_sketch.to_dict()
+        organizations.append(entry)
+
+    return {
+        'organizations': organizations,
+        'startDate': start,
+        'endDate': end,
+        'refreshedAt': datetime.now(timezone.utc).isoformat()
+    }
+
+
+def refresh(sources, days_back=60, today=None):
+    """Fetch, merge and group data from every source for the last days_back days."""
+    end_date = today or date.today()
+    start = (end_date - timedelta(days=days_back)).isoformat()
+    end = end_date.isoformat()
+
+    event_streams, flow_streams = fetch_all(sources, start, end)
+    data = build_dashboard_data(merge_users(event_streams, flow_streams), start, end)
+    data['sources'] = [f"{s.project_id}@{s.host}" for s in sources]
+    return data
+
+
+if __name__ == '__main__':
+    from generate_dashboard import embed_in_dashboard
+
+    dashboard_path = sys.argv[1] if len(sys.argv) > 1 else 'dashboard.html'
+    days_back = int(sys.argv[2]) if len(sys.argv) > 2 else 60
+
+    sources = sources_from_env()
+    print(f"Fetching {days_back} days from {len(sources)} PostHog project(s)...")
+    for s in sources:
+        print(f"  {s.project_id} @ {s.host}")
+
+    started = datetime.now()
+    dashboard_data = refresh(sources, days_back)
+    elapsed = (datetime.now() - started).total_seconds()
+
+    embed_in_dashboard(dashboard_path, dashboard_data)
+    print(f"   Organizations: {len(dashboard_data['organizations'])}")
+    print(f"   Date range: {dashboard_data['startDate']} to {dashboard_data['endDate']}")
+    print(f"   Refreshed in {elapsed:.1f}s")
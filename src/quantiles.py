@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Streaming percentile sketches (merging t-digest).
+
+A TDigest summarises a stream of values in at most ~compression centroids, so
+per-org and per-user daily minute distributions can be tracked while the
+dashboard data is produced, without keeping and sorting every user-day value.
+Digests merge losslessly with respect to their own accuracy, so percentiles for
+any grouping of orgs or date partitions come from merging serialized sketches.
+"""
+
+import math
+
+DEFAULT_COMPRESSION = 100
+PERCENTILES = (0.5, 0.9, 0.99)
+
+
+class TDigest:
+    """Merging t-digest with the arcsine (k1) scale function."""
+
+    def __init__(self, compression=DEFAULT_COMPRESSION):
+        self.compression = compression
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._centroids = []  # sorted (mean, weight)
+        self._buffer = []
+
+    def add(self, value, weight=1):
+        self._buffer.append((value, weight))
+        self.count += weight
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if len(self._buffer) >= 5 * self.compression:
+            self._compress()
+
+    def merge(self, other):
+        """Fold another digest into this one and return self."""
+        if other.count:
+            self._buffer.extend(other._centroids)
+            self._buffer.extend(other._buffer)
+            self.count += other.count
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+            self._compress()
+        return self
+
+    def _k(self, q):
+        return self.compression / (2 * math.pi) * math.asin(2 * min(q, 1.0) - 1)
+
+    def _compress(self):
+        if not self._buffer:
+            return
+        items = sorted(self._centroids + self._buffer)
+        self._buffer = []
+
+        merged = []
+        weight_before = 0
+        mean, weight = items[0]
+        for next_mean, next_weight in items[1:]:
+            q_left = weight_before / self.count
+            q_right = (weight_before + weight + next_weight) / self.count
+            if self._k(q_right) - self._k(q_left) <= 1:
+                weight += next_weight
+                mean += (next_mean - mean) * next_weight / weight
+            else:
+                merged.append((mean, weight))
+                weight_before += weight
+                mean, weight = next_mean, next_weight
+        merged.append((mean, weight))
+        self._centroids = merged
+
+    def quantile(self, q):
+        """Estimate the q-th quantile (0 <= q <= 1), or None if empty."""
+        self._compress()
+        centroids = self._centroids
+        if not centroids:
+            return None
+        if len(centroids) == 1:
+            return centroids[0][0]
+
+        target = q * self.count
+        first_mean, first_weight = centroids[0]
+        if target < first_weight / 2:
+            return self.min + (first_mean - self.min) * target / (first_weight / 2)
+
+        cumulative = 0
+        for (mean, weight), (next_mean, next_weight) in zip(centroids, centroids[1:]):
+            center = cumulative + weight / 2
+            next_center = cumulative + weight + next_weight / 2
+            if target < next_center:
+                return mean + (next_mean - mean) * (target - center) / (next_center - center)
+            cumulative += weight
+
+        last_mean, last_weight = centroids[-1]
+        remaining = self.count - target
+        return self.max - (self.max - last_mean) * remaining / (last_weight / 2)
+
+    def percentiles(self, qs=PERCENTILES):
+        """Return {'p50': ..., 'p90': ..., 'p99': ...} rounded to 0.1."""
+        result = {}
+        for q in qs:
+            value = self.quantile(q)
+            result['p' + format(q * 100, 'g')] = None if value is None else round(value, 1)
+        return result
+
+    def to_dict(self):
+        """Compact form: centroids flattened to [mean, weight, mean, weight, ...]."""
+        self._compress()
+        flat = []
+        for mean, weight in self._centroids:
+            flat.append(round(mean, 3))
+            flat.append(weight)
+        return {
+            'compression': self.compression,
+            'count': self.count,
+            'min': self.min if self.count else None,
+            'max': self.max if self.count else None,
+            'centroids': flat
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        digest = cls(data.get('compression', DEFAULT_COMPRESSION))
+        flat = data['centroids']
+        digest._centroids = list(zip(flat[0::2], flat[1::2]))
+        digest.count = data['count']
+        if digest.count:
+            digest.min = data['min']
+            digest.max = data['max']
+        return digest
+
+
+def merge_sketches(sketches, compression=DEFAULT_COMPRESSION):
+    """Merge serialized sketches (e.g. several orgs or date partitions) into one digest."""
+    digest = TDigest(compression)
+    for sketch in sketches:
+        digest.merge(TDigest.from_dict(sketch))
+    return digest
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Fixed-width binary time-series store for per-user daily activity.
+
+Layout of the .tsdb file:
+- 32-byte header: magic, version, start date (ordinal), days, users
+- a dense users x days matrix of 16-byte cells
+  (minutes float32, events uint32, flows uint32, active uint32)
+
+Rows are per user, so one user's date range is a single contiguous slice.
+Users are addressed by row id: the same email can appear more than once.
+Reads go through mmap and only touch the pages of the rows/days requested,
+instead of json.load-ing the whole dataset. Names, orgs and per-user totals
+live in a small JSON sidecar index (<path>.idx.json).
+
+Usage:
+    python3 src/timeseries_store.py data/customer_data.json data/customer_data.tsdb
+"""
+
+import json
+import mmap
+import os
+import struct
+from datetime import date
+
+try:
+    import numpy
+except ImportError:  # optional: only needed for as_numpy()
+    numpy = None
+
+MAGIC = b'JVTS'
+VERSION = 1
+HEADER = struct.Struct('<4sHxxIII')
+HEADER_SIZE = 32
+CELL = struct.Struct('<fIII')
+STORE_EXT = '.tsdb'
+
+
+def index_path(path):
+    return path + '.idx.json'
+
+
+def _ordinal(date_str):
+    return date.fromisoformat(date_str).toordinal()
+
+
+class TimeSeriesWriter:
+    """
+    Incrementally write users into a store.
+
+    Opening an existing store appends new user rows after the existing ones,
+    and write_day() updates a single cell in place. The date range is fixed
+    when the store is created.
+    """
+
+    def __init__(self, path, start_date=None, end_date=None):
+        self.path = path
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                magic, version, start, days, users = HEADER.unpack_from(f.read(HEADER_SIZE))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not a v{VERSION} time-series store")
+            self.start, self.days, self.num_users = start, days, users
+            with open(index_path(path), 'r') as f:
+                self.index = json.load(f)
+        else:
+            if not start_date or not end_date:
+                raise ValueError("start_date and end_date are required to create a store")
+            self.start = _ordinal(start_date)
+            self.days = _ordinal(end_date) - self.start + 1
+            self.num_users = 0
+            self.index = {
+                'startDate': start_date,
+                'endDate': end_date,
+                'users': [],
+                'orgs': {}
+            }
+            with open(path, 'wb') as f:
+                f.write(self._header())
+        self._file = open(path, 'r+b')
+
+    def _header(self):
+        return HEADER.pack(MAGIC, VERSION, self.start, self.days, self.num_users).ljust(HEADER_SIZE, b'\0')
+
+    def add_user(self, org, user, domain_class=None):
+        """
+        Append one dashboard-format user (email, totals, flows, dailyData)
+        under org and return its row id.
+        """
+        row = bytearray(CELL.size * self.days)
+        for day, values in user.get('dailyData', {}).items():
+            i = _ordinal(day) - self.start
+            if 0 <= i < self.days:
+                CELL.pack_into(row, i * CELL.size,
+                               values.get('timeMinutes', 0),
+                               values.get('events', 0),
+                               values.get('flows', 0),
+                               1)
+
+        meta = {
+            'email': user['email'],
+            'org': org,
+            'totalTimeMinutes': user['totalTimeMinutes'],
+            'events': user['events'],
+            'flows': user.get('flows', {'started': 0, 'completed': 0, 'failed': 0})
+        }
+
+        org_entry = self.index['orgs'].setdefault(org, {'domainClass': domain_class, 'rows': []})
+        if domain_class:
+            org_entry['domainClass'] = domain_class
+
+        row_id = self.num_users
+        self.num_users += 1
+        self.index['users'].append(meta)
+        org_entry['rows'].append(row_id)
+
+        self._file.seek(HEADER_SIZE + row_id * len(row))
+        self._file.write(row)
+        return row_id
+
+    def write_day(self, row_id, day, minutes, events, flows=0):
+        """Overwrite a single (user, day) cell in place."""
+        i = _ordinal(day) - self.start
+        if not 0 <= row_id < self.num_users or not 0 <= i < self.days:
+            raise IndexError(f"cell ({row_id}, {day}) is outside the store")
+        self._file.seek(HEADER_SIZE + (row_id * self.days + i) * CELL.size)
+        self._file.write(CELL.pack(minutes, events, flows, 1))
+
+    def close(self):
+        self._file.seek(0)
+        self._file.write(self._header())
+        self._file.close()
+        with open(index_path(self.path), 'w') as f:
+            json.dump(self.index, f)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class TimeSeriesStore:
+    """Read-only, mmap-backed view of a store."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(index_path(path), 'r') as f:
+            self.index = json.load(f)
+        self._file = open(path, 'rb')
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.start, self.days, self.num_users = HEADER.unpack_from(self._mm)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a v{VERSION} time-series store")
+        self.row_size = CELL.size * self.days
+
+    @property
+    def start_date(self):
+        return self.index['startDate']
+
+    @property
+    def end_date(self):
+        return self.index['endDate']
+
+    def _day_bounds(self, start_date, end_date):
+        lo = 0 if start_date is None else max(0, _ordinal(start_date) - self.start)
+        hi = self.days if end_date is None else min(self.days, _ordinal(end_date) - self.start + 1)
+        return lo, max(lo, hi)
+
+    def orgs(self):
+        """Return (name, domainClass) for every org in insertion order."""
+        return [(name, entry['domainClass']) for name, entry in self.index['orgs'].items()]
+
+    def users(self, org):
+        """Return (row_id, metadata) for every user in org."""
+        return [(i, self.index['users'][i]) for i in self.index['orgs'][org]['rows']]
+
+    def _iter_row(self, row_id, start_date, end_date):
+        lo, hi = self._day_bounds(start_date, end_date)
+        offset = HEADER_SIZE + row_id * self.row_size
+        view = memoryview(self._mm)[offset + lo * CELL.size:offset + hi * CELL.size]
+        try:
+            for i, (minutes, events, flows, active) in enumerate(CELL.iter_unpack(view), lo):
+                if active:
+                    yield i, minutes, events, flows
+        finally:
+            view.release()
+
+    def user_range(self, row_id, start_date=None, end_date=None):
+        """
+        Return {date: {'timeMinutes', 'events', 'flows'}} for one user's active
+        days in [start_date, end_date]. Only that user's row slice is read.
+        """
+        daily = {}
+        for i, minutes, events, flows in self._iter_row(row_id, start_date, end_date):
+            day = date.fromordinal(self.start + i).isoformat()
+            daily[day] = {'timeMinutes': round(minutes, 1), 'events': events, 'flows': flows}
+        return daily
+
+    def org_range(self, org, start_date=None, end_date=None):
+        """Return per-day totals summed over every user in org."""
+        totals = {}
+        for row_id in self.index['orgs'][org]['rows']:
+            for i, minutes, events, flows in self._iter_row(row_id, start_date, end_date):
+                day = date.fromordinal(self.start + i).isoformat()
+                t = totals.setdefault(day, {'timeMinutes': 0, 'events': 0, 'flows': 0})
+                t['timeMinutes'] = round(t['timeMinutes'] + minutes, 1)
+                t['events'] += events
+                t['flows'] += flows
+        return totals
+
+    def as_numpy(self):
+        """Return a numpy.memmap of shape (users, days) with minutes/events/flows/active fields."""
+        if numpy is None:
+            raise ImportError("numpy is required for as_numpy()")
+        dtype = numpy.dtype([('minutes', '<f4'), ('events', '<u4'), ('flows', '<u4'), ('active', '<u4')])
+        return numpy.memmap(self.path, dtype=dtype, mode='r', offset=HEADER_SIZE,
+                            shape=(self.num_users, self.days))
+
+    def close(self):
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_store(dashboard_data, path):
+    """Write transform_for_dashboard() output to a new store at path."""
+    for p in (path, index_path(path)):
+        if os.path.exists(p):
+            os.remove(p)
+    with TimeSeriesWriter(path, dashboard_data['startDate'], dashboard_data['endDate']) as writer:
+        for org in dashboard_data['organizations']:
+            for user in org['users']:
+                writer.add_user(org['name'], user, org.get('domainClass'))
+
+
+if __name__ == '__main__':
+    import sys
+    from generate_dashboard import transform_for_dashboard
+
+    json_path = sys.argv[1] if len(sys.argv) > 1 else 'data/customer_data.json'
+    store_path = sys.argv[2] if len(sys.argv) > 2 else 'data/customer_data' + STORE_EXT
+
+    with open(json_path, 'r') as f:
+        dashboard_data = transform_for_dashboard(json.load(f))
+
+    write_store(dashboard_data, store_path)
+    print(f"✅ Wrote {store_path} ({os.path.getsize(store_path)} bytes)")
@@ -202,6 +202,16 @@ describe('api/refresh.js', () => {
     expect(domains).not.toContain('hotmail.com');
   });
 
+  test('organizations carry their domain class', async () => {
+    const handler = getHandler();
+    const res = createMockRes();
+    await handler(createMockReq(), res);
+
+    const byName = Object.fromEntries(res._json.organizations.map(o => [o.name, o]));
+    expect(byName['acme.com'].domainClass).toBe('customer');
+    expect(byName['personal-email'].domainClass).toBe('anonymous');
+  });
+
   test('data format matches TIME_SERIES_DATA structure', async () => {
     const handler = getHandler();
     const res = createMockRes();
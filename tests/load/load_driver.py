@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Load driver for /api/data and /api/refresh against a local PostHog stub.
+
+For each dataset size the driver points the stub at that many synthetic users,
+clears the API cache, fires concurrent requests at each path and reports
+latency percentiles, throughput, bytes transferred and cache-hit ratio. With
+--stale it also ages the cache past its max age and makes the stub fail, so
+the stale-cache fallback in api/data.js is measured under load.
+
+Unless --base-url is given, the driver starts tests/load/posthog_stub.py
+in-process and tests/load/serve_api.js (node) as the API host. Note that the
+API caches to /tmp/posthog-dashboard-cache.json, which the driver deletes and
+ages between runs.
+
+Usage:
+    python3 tests/load/load_driver.py --sizes 100,1000,5000 --concurrency 16 --requests 200
+"""
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from posthog_stub import StubConfig, start_stub
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SERVE_API = os.path.join(ROOT_DIR, 'tests', 'load', 'serve_api.js')
+CACHE_PATH = '/tmp/posthog-dashboard-cache.json'  # matches api/data.js
+CACHE_MAX_AGE_S = 60 * 60
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_api(stub_url):
+    """Spawn serve_api.js against the stub and wait until it accepts connections."""
+    port = _free_port()
+    env = dict(os.environ, POSTHOG_API_KEY='stub', POSTHOG_HOST=stub_url, PORT=str(port))
+    proc = subprocess.Popen(['node', SERVE_API], env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.2).close()
+            return proc, f'http://127.0.0.1:{port}'
+        except OSError:
+            time.sleep(0.05)
+    proc.kill()
+    raise RuntimeError('serve_api.js did not start (is node installed?)')
+
+
+def fetch(url, timeout):
+    """Return (latency_s, status, bytes, cached, stale) for one GET."""
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as resp:
+            body = resp.read()
+            status = resp.status
+    except urllib.error.HTTPError as e:
+        body = e.read()
+        status = e.code
+    except OSError:
+        return time.perf_counter() - start, 0, 0, False, False
+    latency = time.perf_counter() - start
+
+    cached = stale = False
+    if status == 200:
+        try:
+            data = json.loads(body)
+            cached = bool(data.get('_cached'))
+            stale = bool(data.get('_stale'))
+        except ValueError:
+            pass
+    return latency, status, len(body), cached, stale
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def run_load(url, requests, concurrency, timeout):
+    """Fire requests at url with the given concurrency and summarise the results."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(lambda _: fetch(url, timeout), range(requests)))
+    wall = time.perf_counter() - start
+
+    ok = [r for r in results if r[1] == 200]
+    latencies = sorted(r[0] for r in results)
+    return {
+        'requests': requests,
+        'errors': requests - len(ok),
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 1),
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 1),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 1),
+        'throughput_rps': round(requests / wall, 1) if wall else 0.0,
+        'bytes': sum(r[2] for r in results),
+        'cache_hit_ratio': round(sum(r[3] for r in ok) / len(ok), 3) if ok else 0.0,
+        'stale_ratio': round(sum(r[4] for r in ok) / len(ok), 3) if ok else 0.0,
+    }
+
+
+def clear_cache():
+    if os.path.exists(CACHE_PATH):
+        os.remove(CACHE_PATH)
+
+
+def age_cache():
+    """Push the cache mtime past CACHE_MAX_AGE_MS so api/data.js treats it as expired."""
+    if os.path.exists(CACHE_PATH):
+        old = time.time() - 2 * CACHE_MAX_AGE_S
+        os.utime(CACHE_PATH, (old, old))
+
+
+def print_report(rows):
+    header = f"{'users':>7} {'path':<14} {'reqs':>5} {'err':>4} {'p50ms':>8} {'p95ms':>8} " \
+             f"{'p99ms':>8} {'req/s':>7} {'MB':>8} {'hit%':>6} {'stale%':>6}"
+    print(header)
+    print('-' * len(header))
+    for row in rows:
+        print(f"{row['users'] if row['users'] is not None else '-':>7} {row['path']:<14} "
+              f"{row['requests']:>5} {row['errors']:>4} {row['p50_ms']:>8} {row['p95_ms']:>8} "
+              f"{row['p99_ms']:>8} {row['throughput_rps']:>7} {row['bytes'] / 1e6:>8.2f} "
+              f"{row['cache_hit_ratio'] * 100:>6.1f} {row['stale_ratio'] * 100:>6.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default='100,1000,5000',
+                        help='comma-separated synthetic user counts')
+    parser.add_argument('--days', type=int, default=60)
+    parser.add_argument('--paths', default='data,refresh')
+    parser.add_argument('--requests', type=int, default=100)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--latency-ms', type=int, default=100,
+                        help='simulated PostHog query latency')
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help='fraction of stub queries that fail with 503')
+    parser.add_argument('--stale', action='store_true',
+                        help='also measure /api/data serving an expired cache while PostHog fails')
+    parser.add_argument('--timeout', type=float, default=60.0)
+    parser.add_argument('--base-url', help='existing API host; skips the local stub and node host')
+    parser.add_argument('--json', help='write results to this file')
+    args = parser.parse_args()
+
+    paths = [p.strip() for p in args.paths.split(',') if p.strip()]
+    config = None
+    api_proc = None
+    if args.base_url:
+        base_url = args.base_url.rstrip('/')
+        sizes = [None]
+    else:
+        config = StubConfig(latency_ms=args.latency_ms, error_rate=args.error_rate)
+        stub, _ = start_stub(0, config)
+        api_proc, base_url = start_api(f'http://127.0.0.1:{stub.server_address[1]}')
+        sizes = [int(s) for s in args.sizes.split(',')]
+
+    rows = []
+    try:
+        for size in sizes:
+            if config:
+                config.users = size
+                clear_cache()
+            for path in paths:
+                url = f'{base_url}/api/{path}?days={args.days}'
+                rows.append({'users': size, 'path': path,
+                             **run_load(url, args.requests, args.concurrency, args.timeout)})
+
+            if args.stale and config:
+                error_rate = config.error_rate
+                urllib.request.urlopen(f'{base_url}/api/refresh?days={args.days}',
+                                       timeout=args.timeout).read()
+                age_cache()
+                config.error_rate = 1.0
+                url = f'{base_url}/api/data?days={args.days}'
+                rows.append({'users': size, 'path': 'data (stale)',
+                             **run_load(url, args.requests, args.concurrency, args.timeout)})
+                config.error_rate = error_rate
+    finally:
+        if api_proc:
+            api_proc.terminate()
+            api_proc.wait()
+
+    print_report(rows)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(rows, f, indent=2)
+        print(f"\nSaved to {args.json}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
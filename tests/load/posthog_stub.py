@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Local stub of the PostHog HogQL query endpoint for load testing.
+
+Answers POST /api/projects/<id>/query/ with synthetic rows shaped like the two
+queries in api/refresh.js:
+- events query: [identifier, day, event_count, active_minutes], ordered by
+  (identifier, day) and truncated to the query's LIMIT
+- flows query:  [identifier, event, count]
+
+Volume, latency and error rate are configurable, and responses are cached per
+(users, start, end) so the stub itself does not become the bottleneck.
+
+Usage:
+    python3 tests/load/posthog_stub.py --port 8010 --users 5000 --latency-ms 200
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+GENERIC_SHARE = 0.1
+ANONYMOUS_SHARE = 0.1
+USERS_PER_ORG = 5
+FLOW_EVENTS = ['flow_started', 'flow_completed', 'flow_failed']
+
+
+def synthetic_identifiers(users, seed=0):
+    """Return sorted identifiers: customer emails, generic-domain emails and anonymous ids."""
+    rng = random.Random(seed)
+    identifiers = []
+    for i in range(users):
+        roll = rng.random()
+        if roll < ANONYMOUS_SHARE:
+            identifiers.append(f'{rng.getrandbits(64):016x}-anon{i}')
+        elif roll < ANONYMOUS_SHARE + GENERIC_SHARE:
+            identifiers.append(f'user{i}@gmail.com')
+        else:
+            identifiers.append(f'user{i}@org{i // USERS_PER_ORG}.example.com')
+    return sorted(identifiers)
+
+
+def event_rows(users, start, end, limit=None, seed=0):
+    """Rows for the per-(identifier, day) events query, sorted by (identifier, day)."""
+    rng = random.Random(seed)
+    days = []
+    d = start
+    while d <= end:
+        days.append(d.isoformat())
+        d += timedelta(days=1)
+
+    rows = []
+    for identifier in synthetic_identifiers(users, seed):
+        for day in days:
+            if rng.random() < 0.4:
+                continue
+            events = rng.randint(1, 400)
+            rows.append([identifier, day, events, rng.randint(1, min(events, 240))])
+            if limit is not None and len(rows) >= limit:
+                return rows
+    return rows
+
+
+def flow_rows(users, seed=0):
+    """Rows for the per-(identifier, event) flows query."""
+    rng = random.Random(seed + 1)
+    rows = []
+    for identifier in synthetic_identifiers(users, seed):
+        for event in FLOW_EVENTS:
+            if rng.random() < 0.5:
+                rows.append([identifier, event, rng.randint(1, 20)])
+    return rows
+
+
+class StubConfig:
+    """Mutable settings shared by all handler threads."""
+
+    def __init__(self, users=1000, latency_ms=0, error_rate=0.0, seed=0):
+        self.users = users
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self.seed = seed
+        self.requests = 0
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def body_for(self, query):
+        """Return the encoded JSON response for a HogQL query string."""
+        dates = re.findall(r"timestamp\s*[><]=\s*'(\d{4}-\d{2}-\d{2})", query)
+        start = date.fromisoformat(dates[0]) if dates else date.today() - timedelta(days=60)
+        end = date.fromisoformat(dates[1]) if len(dates) > 1 else date.today()
+        limit = re.search(r'LIMIT\s+(\d+)', query)
+        kind = 'flows' if 'flow_started' in query else 'events'
+        key = (kind, self.users, start, end, self.seed)
+
+        with self._lock:
+            body = self._cache.get(key)
+        if body is None:
+            if kind == 'flows':
+                rows = flow_rows(self.users, self.seed)
+            else:
+                rows = event_rows(self.users, start, end,
+                                  int(limit.group(1)) if limit else None, self.seed)
+            body = json.dumps({'results': rows}).encode()
+            with self._lock:
+                self._cache[key] = body
+        return body
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    config = None
+
+    def do_POST(self):
+        config = self.config
+        length = int(self.headers.get('Content-Length', 0))
+        payload = json.loads(self.rfile.read(length) or b'{}')
+        with config._lock:
+            config.requests += 1
+
+        if config.latency_ms:
+            time.sleep(config.latency_ms / 1000)
+
+        if not re.match(r'^/api/projects/[^/]+/query/?$', self.path):
+            return self._send(404, b'{"detail": "Not found"}')
+        if config.error_rate and random.random() < config.error_rate:
+            return self._send(503, b'{"detail": "Stub injected failure"}')
+
+        query = payload.get('query', {}).get('query', '')
+        self._send(200, config.body_for(query))
+
+    def _send(self, status, body):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub(port=0, config=None):
+    """Start the stub in a daemon thread and return (server, config)."""
+    config = config or StubConfig()
+    handler = type('BoundStubHandler', (StubHandler,), {'config': config})
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, config
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--port', type=int, default=8010)
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--latency-ms', type=int, default=0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    config = StubConfig(args.users, args.latency_ms, args.error_rate, args.seed)
+    server, _ = start_stub(args.port, config)
+    print(f"PostHog stub listening on http://127.0.0.1:{server.server_address[1]} "
+          f"({args.users} users, {args.latency_ms}ms latency)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+/**
+ * Minimal local host for the Vercel functions in api/, used by the load driver.
+ *
+ * Routes /api/data and /api/refresh to their handlers with a Vercel-style
+ * req/res shim. Point POSTHOG_HOST at tests/load/posthog_stub.py to run
+ * without touching real PostHog.
+ *
+ * Usage:
+ *   POSTHOG_API_KEY=stub POSTHOG_HOST=http://127.0.0.1:8010 PORT=3000 node tests/load/serve_api.js
+ */
+
+const http = require('http');
+const path = require('path');
+
+const ROUTES = {
+  '/api/data': require(path.join(__dirname, '../../api/data')),
+  '/api/refresh': require(path.join(__dirname, '../../api/refresh'))
+};
+
+function vercelRes(res) {
+  return {
+    setHeader: (k, v) => res.setHeader(k, v),
+    status(code) {
+      return {
+        json(data) {
+          const body = JSON.stringify(data);
+          res.writeHead(code, { 'Content-Type': 'application/json' });
+          res.end(body);
+        },
+        end() {
+          res.writeHead(code);
+          res.end();
+        }
+      };
+    }
+  };
+}
+
+const server = http.createServer(async (req, res) => {
+  const url = new URL(req.url, 'http://localhost');
+  const handler = ROUTES[url.pathname];
+  if (!handler) {
+    res.writeHead(404, { 'Content-Type': 'application/json' });
+    return res.end(JSON.stringify({ error: 'Not found' }));
+  }
+  const vreq = { method: req.method, query: Object.fromEntries(url.searchParams) };
+  try {
+    await handler(vreq, vercelRes(res));
+  } catch (err) {
+    if (!res.headersSent) res.writeHead(500, { 'Content-Type': 'application/json' });
+    res.end(JSON.stringify({ error: err.message }));
+  }
+});
+
+const port = parseInt(process.env.PORT || '3000', 10);
+server.listen(port, '127.0.0.1', () => {
+  console.log(`API listening on http://127.0.0.1:${server.address().port}`);
+});
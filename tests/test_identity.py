@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Identity Tests - Validates domain classification and identifier resolution."""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+from identity import DomainTrie, IdentityResolver, CUSTOMER, GENERIC, INTERNAL, ANONYMOUS
+
+
+class TestDomainTrie(unittest.TestCase):
+    """Test suffix matching on reversed domain labels."""
+
+    def setUp(self):
+        self.trie = DomainTrie()
+        self.trie.add('jarvio.io', INTERNAL)
+        self.trie.add('mail.com', GENERIC)
+
+    def test_exact_match(self):
+        self.assertEqual(self.trie.lookup('jarvio.io'), INTERNAL)
+
+    def test_subdomain_match(self):
+        self.assertEqual(self.trie.lookup('eu.app.jarvio.io'), INTERNAL)
+
+    def test_label_boundary(self):
+        # gmail.com must not match mail.com
+        self.assertIsNone(self.trie.lookup('gmail.com'))
+        self.assertIsNone(self.trie.lookup('notjarvio.io'))
+
+    def test_longest_suffix_wins(self):
+        self.trie.add('partner.jarvio.io', CUSTOMER)
+        self.assertEqual(self.trie.lookup('x.partner.jarvio.io'), CUSTOMER)
+        self.assertEqual(self.trie.lookup('x.jarvio.io'), INTERNAL)
+
+
+class TestIdentityResolver(unittest.TestCase):
+    """Test that identifiers resolve to the same orgs as api/refresh.js."""
+
+    def setUp(self):
+        self.resolver = IdentityResolver()
+
+    def test_customer_email(self):
+        self.assertEqual(self.resolver.resolve('Alice@Acme.com '),
+                         ('alice@acme.com', 'acme.com', CUSTOMER))
+
+    def test_generic_email_grouped(self):
+        self.assertEqual(self.resolver.resolve('bob@gmail.com'),
+                         ('bob@gmail.com', 'personal-email', ANONYMOUS))
+
+    def test_internal_email(self):
+        self.assertEqual(self.resolver.resolve('dev@jarvioapp.com')[2], INTERNAL)
+
+    def test_anonymous_identifier(self):
+        self.assertEqual(self.resolver.resolve('0190ABCDEF123456'),
+                         ('anon-0190abcd', 'anonymous', ANONYMOUS))
+
+    def test_email_without_domain(self):
+        self.assertIsNone(self.resolver.resolve('broken@'))
+
+    def test_resolution_is_cached_and_interned(self):
+        first = self.resolver.resolve('carol@acme.com')
+        second = self.resolver.resolve('carol@acme.com')
+        self.assertIs(first, second)
+        other = self.resolver.resolve('dave@acme.com')
+        self.assertIs(first[1], other[1])
+
+    def test_classify_org_names(self):
+        self.assertEqual(self.resolver.classify_domain('mozmail.com'), GENERIC)
+        self.assertEqual(self.resolver.classify_domain('personal-email'), ANONYMOUS)
+        self.assertEqual(self.resolver.classify_domain('enflet.io'), CUSTOMER)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Multi-Source Tests - Validates concurrent PostHog fan-out and k-way merging."""
+
+import os
+import sys
+import time
+import unittest
+from datetime import date
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(BASE_DIR, 'src'))
+sys.path.insert(0, os.path.join(BASE_DIR, 'tests', 'load'))
+from posthog_sources import Source, fetch_event_rows, merge_users, refresh, sources_from_env
+from posthog_stub import StubConfig, start_stub
+
+
+class TestSourcesFromEnv(unittest.TestCase):
+    """Test POSTHOG_SOURCES parsing."""
+
+    def test_single_project_fallback(self):
+        sources = sources_from_env({'POSTHOG_API_KEY': 'k', 'POSTHOG_PROJECT_ID': '1',
+                                    'POSTHOG_HOST': 'https://us.i.posthog.com'})
+        self.assertEqual(sources, [Source('1', 'https://us.i.posthog.com', 'k')])
+
+    def test_multiple_projects(self):
+        sources = sources_from_env({
+            'POSTHOG_API_KEY': 'k',
+            'POSTHOG_SOURCES': '54557@https://eu.i.posthog.com, 9@http://127.0.0.1:8010/,'
+                               '7@https://us.i.posthog.com:phx_us'
+        })
+        self.assertEqual(sources, [
+            Source('54557', 'https://eu.i.posthog.com', 'k'),
+            Source('9', 'http://127.0.0.1:8010', 'k'),
+            Source('7', 'https://us.i.posthog.com', 'phx_us'),
+        ])
+
+    def test_invalid_entry(self):
+        with self.assertRaises(ValueError):
+            sources_from_env({'POSTHOG_SOURCES': 'https://eu.i.posthog.com'})
+
+
+class TestMergeUsers(unittest.TestCase):
+    """Test the k-way merge of sorted per-project streams."""
+
+    def setUp(self):
+        eu = [('alice@acme.com', '2026-02-01', 10, 4),
+              ('alice@acme.com', '2026-02-02', 5, 2),
+              ('carol@acme.com', '2026-02-01', 1, 1)]
+        us = [('alice@acme.com', '2026-02-02', 7, 3),
+              ('bob@acme.com', '2026-02-03', 2, 1)]
+        flows = [[('alice@acme.com', 'flow_started', 2), ('zed@acme.com', 'flow_started', 9)],
+                 [('alice@acme.com', '$flow_failed', 1), ('bob@acme.com', 'Flow Completed', 4)]]
+        self.users = dict(merge_users([eu, us], flows))
+
+    def test_identifiers_in_order(self):
+        self.assertEqual(list(self.users), ['alice@acme.com', 'bob@acme.com', 'carol@acme.com'])
+
+    def test_same_day_summed_across_projects(self):
+        alice = self.users['alice@acme.com']
+        self.assertEqual(alice['dailyData']['2026-02-02'], {'timeMinutes': 5, 'events': 12})
+        self.assertEqual(alice['totalEvents'], 22)
+        self.assertEqual(alice['totalTimeMinutes'], 9)
+
+    def test_flows_joined(self):
+        self.assertEqual(self.users['alice@acme.com']['flowsStarted'], 2)
+        self.assertEqual(self.users['alice@acme.com']['flowsFailed'], 1)
+        self.assertEqual(self.users['bob@acme.com']['flowsCompleted'], 4)
+        self.assertNotIn('zed@acme.com', self.users)
+
+
+class TestConcurrentRefresh(unittest.TestCase):
+    """Test fan-out against two local PostHog stubs."""
+
+    LATENCY_MS = 300
+
+    @classmethod
+    def setUpClass(cls):
+        cls.servers = []
+        cls.sources = []
+        for seed in (0, 1):
+            server, _ = start_stub(0, StubConfig(users=50, latency_ms=cls.LATENCY_MS, seed=seed))
+            cls.servers.append(server)
+            cls.sources.append(Source(str(seed), f'http://127.0.0.1:{server.server_address[1]}', 'k'))
+
+    @classmethod
+    def tearDownClass(cls):
+        for server in cls.servers:
+            server.shutdown()
+            server.server_close()
+
+    def test_refresh_time_close_to_slowest_project(self):
+        started = time.perf_counter()
+        refresh(self.sources, 14, today=date(2026, 2, 15))
+        elapsed = time.perf_counter() - started
+        # 2 projects x 2 queries sequentially would take 4x the stub latency
+        self.assertLess(elapsed, 2 * self.LATENCY_MS / 1000)
+
+    def test_merged_totals_match_per_project_sum(self):
+        data = refresh(self.sources, 14, today=date(2026, 2, 15))
+        expected = sum(row[2] for s in self.sources
+                       for row in fetch_event_rows(s, '2026-02-01', '2026-02-15'))
+        actual = sum(u['events'] for org in data['organizations'] for u in org['users'])
+        self.assertEqual(actual, expected)
+        self.assertEqual(len(data['sources']), 2)
+
+    def test_org_structure(self):
+        data = refresh(self.sources, 14, today=date(2026, 2, 15))
+        names = {org['name']: org for org in data['organizations']}
+        self.assertEqual(names['personal-email']['domainClass'], 'anonymous')
+        self.assertEqual(names['org0.example.com']['domainClass'], 'customer')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""PostHog Stub Tests - Validates the synthetic HogQL responses used by the load driver."""
+
+import json
+import os
+import sys
+import unittest
+import urllib.error
+import urllib.request
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'load'))
+from posthog_stub import StubConfig, event_rows, start_stub
+
+EVENTS_QUERY = """
+    SELECT coalesce(person.properties.email, distinct_id) as identifier, toDate(timestamp) as day,
+           count() as event_count, uniq(toStartOfMinute(timestamp)) as active_minutes
+    FROM events
+    WHERE timestamp >= '2026-02-01' AND timestamp <= '2026-02-07T23:59:59'
+    GROUP BY identifier, day ORDER BY identifier, day LIMIT 100000
+"""
+
+
+class TestSyntheticRows(unittest.TestCase):
+    """Test the shape and ordering of generated rows."""
+
+    def test_rows_sorted_by_identifier_and_day(self):
+        rows = event_rows(200, date(2026, 2, 1), date(2026, 2, 7))
+        keys = [(r[0], r[1]) for r in rows]
+        self.assertEqual(keys, sorted(keys))
+
+    def test_active_minutes_never_exceed_events(self):
+        for _, _, events, minutes in event_rows(50, date(2026, 2, 1), date(2026, 2, 7)):
+            self.assertLessEqual(minutes, events)
+
+    def test_limit_truncates(self):
+        self.assertEqual(len(event_rows(1000, date(2026, 1, 1), date(2026, 2, 28), limit=500)), 500)
+
+
+class TestStubServer(unittest.TestCase):
+    """Test the stub over HTTP."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server, cls.config = start_stub(0, StubConfig(users=20))
+        cls.url = f'http://127.0.0.1:{cls.server.server_address[1]}/api/projects/1/query/'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def post(self, query):
+        body = json.dumps({'query': {'kind': 'HogQLQuery', 'query': query}}).encode()
+        req = urllib.request.Request(self.url, data=body, headers={'Content-Type': 'application/json'})
+        with urllib.request.urlopen(req) as resp:
+            return json.loads(resp.read())
+
+    def test_events_query_respects_date_range(self):
+        days = {row[1] for row in self.post(EVENTS_QUERY)['results']}
+        self.assertTrue(days)
+        self.assertTrue(all('2026-02-01' <= d <= '2026-02-07' for d in days))
+
+    def test_flows_query(self):
+        rows = self.post("SELECT ... WHERE event IN ('flow_started', 'flow_completed')")['results']
+        self.assertTrue(all(len(r) == 3 for r in rows))
+
+    def test_injected_errors(self):
+        self.config.error_rate = 1.0
+        try:
+            with self.assertRaises(urllib.error.HTTPError) as ctx:
+                self.post(EVENTS_QUERY)
+            self.assertEqual(ctx.exception.code, 503)
+        finally:
+            self.config.error_rate = 0.0
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Quantile Sketch Tests - Validates t-digest accuracy, merging and serialization."""
+
+import json
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+from quantiles import TDigest, merge_sketches
+from generate_dashboard import transform_for_dashboard
+
+CUSTOMER_DATA = {
+    'dateRange': {'start': '2026-02-01', 'end': '2026-02-03'},
+    'customers': [
+        {
+            'name': 'acme.com',
+            'totalEvents': 100,
+            'dailyData': [
+                {'date': '2026-02-01', 'events': 20},
+                {'date': '2026-02-02', 'events': 30},
+                {'date': '2026-02-03', 'events': 50},
+            ],
+            'users': [
+                {'email': 'alice@acme.com', 'events': 60, 'totalTimeMinutes': 100, 'flows': 0},
+                {'email': 'bob@acme.com', 'events': 40, 'totalTimeMinutes': 10, 'flows': 0},
+            ]
+        }
+    ]
+}
+
+
+def exact_quantile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+class TestTDigest(unittest.TestCase):
+    """Test streaming quantile estimates against exact values."""
+
+    @classmethod
+    def setUpClass(cls):
+        rng = random.Random(42)
+        cls.values = [rng.expovariate(1 / 30) for _ in range(20000)]
+
+    def test_empty(self):
+        self.assertIsNone(TDigest().quantile(0.5))
+        self.assertEqual(TDigest().percentiles(), {'p50': None, 'p90': None, 'p99': None})
+
+    def test_small_stream_is_exact(self):
+        digest = TDigest()
+        for v in [5, 1, 3, 2, 4]:
+            digest.add(v)
+        self.assertEqual(digest.quantile(0.5), 3)
+        self.assertEqual(digest.quantile(0), 1)
+        self.assertEqual(digest.quantile(1), 5)
+
+    def test_large_stream_accuracy(self):
+        digest = TDigest()
+        for v in self.values:
+            digest.add(v)
+        self.assertLessEqual(len(digest.to_dict()['centroids']) // 2, 2 * digest.compression)
+        for q in (0.5, 0.9, 0.99):
+            exact = exact_quantile(self.values, q)
+            self.assertAlmostEqual(digest.quantile(q), exact, delta=exact * 0.02)
+
+    def test_merge_matches_single_stream(self):
+        parts = [TDigest() for _ in range(4)]
+        for i, v in enumerate(self.values):
+            parts[i % 4].add(v)
+        merged = merge_sketches([p.to_dict() for p in parts])
+        self.assertEqual(merged.count, len(self.values))
+        for q in (0.5, 0.9, 0.99):
+            exact = exact_quantile(self.values, q)
+            self.assertAlmostEqual(merged.quantile(q), exact, delta=exact * 0.02)
+
+    def test_serialization_round_trip(self):
+        digest = TDigest()
+        for v in self.values[:1000]:
+            digest.add(v)
+        restored = TDigest.from_dict(json.loads(json.dumps(digest.to_dict())))
+        self.assertEqual(restored.count, 1000)
+        self.assertAlmostEqual(restored.quantile(0.9), digest.quantile(0.9), places=2)
+
+
+class TestDashboardPercentiles(unittest.TestCase):
+    """Test that transform_for_dashboard emits sketches and percentiles."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.org = transform_for_dashboard(CUSTOMER_DATA)['organizations'][0]
+
+    def test_user_percentiles(self):
+        alice = self.org['users'][0]
+        # alice's days: 20.0, 30.0, 50.0 minutes
+        self.assertEqual(alice['timePercentiles']['p50'], 30.0)
+
+    def test_org_sketch_covers_all_user_days(self):
+        self.assertEqual(self.org['timeSketch']['count'], 6)
+        self.assertEqual(self.org['timeSketch']['max'], 50.0)
+        self.assertIn('p99', self.org['timePercentiles'])
+
+    def test_org_sketches_merge(self):
+        merged = merge_sketches([self.org['timeSketch'], self.org['timeSketch']])
+        self.assertEqual(merged.count, 12)
+        self.assertEqual(merged.quantile(0.5), TDigest.from_dict(self.org['timeSketch']).quantile(0.5))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
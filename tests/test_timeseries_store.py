@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Time-Series Store Tests - Validates binary store round-trips and range reads."""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+from timeseries_store import TimeSeriesStore, TimeSeriesWriter, write_store
+from generate_dashboard import load_from_store
+
+DASHBOARD_DATA = {
+    'startDate': '2026-02-01',
+    'endDate': '2026-02-10',
+    'organizations': [
+        {
+            'name': 'acme.com',
+            'domainClass': 'customer',
+            'users': [
+                {
+                    'email': 'alice@acme.com',
+                    'totalTimeMinutes': 30,
+                    'events': 70,
+                    'flows': {'started': 2, 'completed': 1, 'failed': 0},
+                    'dailyData': {
+                        '2026-02-01': {'timeMinutes': 12.3, 'events': 40},
+                        '2026-02-05': {'timeMinutes': 17.7, 'events': 30},
+                    }
+                },
+                {
+                    'email': 'bob@acme.com',
+                    'totalTimeMinutes': 5,
+                    'events': 9,
+                    'flows': {'started': 0, 'completed': 0, 'failed': 0},
+                    'dailyData': {'2026-02-05': {'timeMinutes': 5.0, 'events': 9}}
+                }
+            ]
+        },
+        {
+            'name': 'jarvioapp.com',
+            'domainClass': 'internal',
+            'users': [
+                {
+                    'email': 'dev@jarvioapp.com',
+                    'totalTimeMinutes': 1,
+                    'events': 2,
+                    'flows': {'started': 0, 'completed': 0, 'failed': 0},
+                    'dailyData': {'2026-02-10': {'timeMinutes': 1.0, 'events': 2}}
+                }
+            ]
+        }
+    ]
+}
+
+
+class TestTimeSeriesStore(unittest.TestCase):
+    """Test writing a store and reading it back through mmap."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'data.tsdb')
+        write_store(DASHBOARD_DATA, self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_file_size_is_fixed_width(self):
+        # 32-byte header + 3 users x 10 days x 16-byte cells
+        self.assertEqual(os.path.getsize(self.path), 32 + 3 * 10 * 16)
+
+    def test_round_trip_matches_dashboard_data(self):
+        loaded = load_from_store(self.path)
+        for org in loaded['organizations']:
+            del org['timePercentiles'], org['timeSketch']
+            for user in org['users']:
+                del user['timePercentiles']
+        self.assertEqual(loaded, DASHBOARD_DATA)
+
+    def test_user_range(self):
+        with TimeSeriesStore(self.path) as store:
+            daily = store.user_range(0, '2026-02-02', '2026-02-10')
+        self.assertEqual(daily, {'2026-02-05': {'timeMinutes': 17.7, 'events': 30, 'flows': 0}})
+
+    def test_org_range(self):
+        with TimeSeriesStore(self.path) as store:
+            daily = store.org_range('acme.com', '2026-02-05', '2026-02-05')
+        self.assertEqual(daily, {'2026-02-05': {'timeMinutes': 22.7, 'events': 39, 'flows': 0}})
+
+    def test_range_outside_store_is_empty(self):
+        with TimeSeriesStore(self.path) as store:
+            self.assertEqual(store.user_range(0, '2026-03-01', '2026-03-31'), {})
+
+    def test_zero_activity_day_is_kept(self):
+        with TimeSeriesWriter(self.path) as writer:
+            writer.write_day(1, '2026-02-07', 0.0, 0)
+        with TimeSeriesStore(self.path) as store:
+            self.assertIn('2026-02-07', store.user_range(1))
+
+    def test_incremental_write(self):
+        with TimeSeriesWriter(self.path) as writer:
+            writer.write_day(1, '2026-02-06', 3.0, 3)
+            row_id = writer.add_user('newco.io', {
+                'email': 'eve@newco.io',
+                'totalTimeMinutes': 4,
+                'events': 4,
+                'dailyData': {'2026-02-03': {'timeMinutes': 4.0, 'events': 4}}
+            }, 'customer')
+        self.assertEqual(row_id, 3)
+
+        with TimeSeriesStore(self.path) as store:
+            self.assertEqual(store.num_users, 4)
+            self.assertEqual(sorted(store.user_range(1)), ['2026-02-05', '2026-02-06'])
+            self.assertEqual(store.users('newco.io'), [(3, store.index['users'][3])])
+            self.assertEqual(store.user_range(3), {'2026-02-03': {'timeMinutes': 4.0, 'events': 4, 'flows': 0}})
+            self.assertIn(('newco.io', 'customer'), store.orgs())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)